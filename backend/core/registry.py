@@ -1,4 +1,5 @@
 # registry.py
+import inspect
 from typing import Dict, Type, Literal
 from core.logger import logger
 
@@ -22,18 +23,49 @@ def register_node(name: str):
         cls.NODE_TYPE_NAME = name
         if hasattr(cls, "DISPLAY_NAME"):
             NODE_DISPLAY_NAME_MAPPINGS[name] = cls.DISPLAY_NAME
+        cls._node_info = _build_static_node_info(name, cls)
         return cls
 
     return decorator
 
 
+def _build_static_node_info(name: str, cls) -> Dict:
+    """
+    节点类定义后不会再变的前端协议字段，注册时计算一次（不含 input）
+    """
+    # RETURN_TYPES: 输出类型的列表 (e.g. ["IMAGE", "MASK"])
+    # RETURN_NAMES: 输出插槽的名称 (e.g. ["Image", "Alpha"]) - 可选
+    return_types = getattr(cls, "RETURN_TYPES", [])
+    return_names = getattr(cls, "RETURN_NAMES", [])
+
+    # 如果没有定义输出名称，默认生成 output_0, output_1... 或者直接用类型名
+    if not return_names and return_types:
+        return_names = return_types
+
+    # cleandoc 同时去掉缩进和首尾空行
+    description = getattr(cls, "DESCRIPTION", None) or inspect.cleandoc(cls.__doc__ or "") or "No description."
+
+    return {
+        "name": name,
+        "type": name,  # 前端期望 type 字段，与 name 相同以保持兼容性
+        "display_name": getattr(cls, "DISPLAY_NAME", name),
+        "category": getattr(cls, "CATEGORY", "User/Custom"),
+        "description": description,
+        "output": return_types,
+        "output_name": return_names,
+        "output_node": getattr(cls, "OUTPUT_NODE", False),
+    }
+
+
 def get_node_info():
     """
     生成符合标准的前端协议 JSON
+
+    静态字段来自注册时的 _node_info；INPUT_TYPES 每次实时调用，
+    模型列表等动态输入（如 model_name）新增后无需重启即可出现。
     """
     info = {}
     for name, cls in NODE_CLASS_MAPPINGS.items():
-        # 1. 获取输入定义
         # ComfyUI 标准: INPUT_TYPES 必须是类方法
         if hasattr(cls, "INPUT_TYPES"):
             try:
@@ -44,32 +76,5 @@ def get_node_info():
         else:
             input_config = {"required": {}, "optional": {}}
 
-        # 2. 处理输出定义
-        # RETURN_TYPES: 输出类型的列表 (e.g. ["IMAGE", "MASK"])
-        # RETURN_NAMES: 输出插槽的名称 (e.g. ["Image", "Alpha"]) - 可选
-        return_types = getattr(cls, "RETURN_TYPES", [])
-        return_names = getattr(cls, "RETURN_NAMES", [])
-
-        # 如果没有定义输出名称，默认生成 output_0, output_1... 或者直接用类型名
-        if not return_names and return_types:
-            return_names = return_types
-
-        # 3. 获取其他元数据
-        category = getattr(cls, "CATEGORY", "User/Custom")
-        display_name = getattr(cls, "DISPLAY_NAME", name)
-        description = getattr(cls, "DESCRIPTION", None) or (cls.__doc__.strip() if cls.__doc__ else "No description.")
-
-        # 4. 获取进度类型（兼容字符串和枚举）
-        info[name] = {
-            "name": name,
-            "type": name,  # 前端期望 type 字段，与 name 相同以保持兼容性
-            "display_name": display_name,
-            "category": category,
-            "description": description,
-            "input": input_config,
-            "output": return_types,
-            "output_name": return_names,
-            # 告诉前端这个节点实际执行哪个函数（虽然前端不一定用，但这是协议的一部分）
-            "output_node": getattr(cls, "OUTPUT_NODE", False),
-        }
+        info[name] = {**cls._node_info, "input": input_config}
     return info
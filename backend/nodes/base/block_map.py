@@ -257,7 +257,11 @@ class BaseMapBlockNode:
                 f"{type(self).__name__}.preprocess() must return dict or None, "
                 f"got {type(preprocess_state).__name__}."
             )
-        self._preprocess_state = dict(preprocess_state)
+        # Only OUTPUT_NODE / STATEFUL instances are per-run (the executor reads
+        # this back for postprocess); other nodes share one instance across
+        # runs and threads, so their state stays local to this call.
+        if getattr(type(self), "OUTPUT_NODE", False) or getattr(type(self), "STATEFUL", False):
+            self._preprocess_state = dict(preprocess_state)
 
         output_dtype = self._resolve_output_dtype(
             dask_arr.dtype,
@@ -413,6 +417,8 @@ class BaseMapBlockNode:
         failure_policy = self.FAILURE_POLICY
         enforce_same_shape = True
         should_apply_skip_policy = True
+        # Signature inspection happens once here, not once per block.
+        process_plan = self._get_process_block_plan()
 
         def wrapped(block, block_info=None):
             block_info = block_info or {}
@@ -432,7 +438,7 @@ class BaseMapBlockNode:
                 if should_apply_skip_policy and self._should_skip(block, block_info, params, runtime):
                     return np.zeros_like(block, dtype=output_dtype)
 
-                result = self._call_process_block(block, params, ctx)
+                result = self._call_process_block(block, params, ctx, plan=process_plan)
                 self._validate_output_block(result, block, enforce_same_shape=enforce_same_shape)
                 self._validate_output_dtype(
                     result=result,
@@ -540,14 +546,40 @@ class BaseMapBlockNode:
             pass
         return None
 
-    def _call_process_block(self, block: np.ndarray, params: dict, ctx: BlockContext) -> np.ndarray:
+    def _get_process_block_plan(self) -> tuple:
+        """
+        Inspect PROCESS_BLOCK once and return (fn, is_legacy, param_specs,
+        accepts_kwargs), where param_specs lists (name, has_default) for the
+        parameters after ``block``.
+        """
         fn = self._get_process_block_callable()
-        sig = inspect.signature(fn)
-        parameters = list(sig.parameters.values())
+        parameters = list(inspect.signature(fn).parameters.values())
         if not parameters:
             raise TypeError(f"{type(self).__name__} PROCESS_BLOCK must accept block as its first parameter.")
-
         if self._is_legacy_process_signature(parameters):
+            return fn, True, (), False
+
+        param_specs = []
+        accepts_kwargs = False
+        for param in parameters[1:]:
+            if param.kind == inspect.Parameter.VAR_POSITIONAL:
+                continue
+            if param.kind == inspect.Parameter.VAR_KEYWORD:
+                accepts_kwargs = True
+                continue
+            param_specs.append((param.name, param.default is not inspect.Parameter.empty))
+        return fn, False, tuple(param_specs), accepts_kwargs
+
+    def _call_process_block(
+        self,
+        block: np.ndarray,
+        params: dict,
+        ctx: BlockContext,
+        plan: Optional[tuple] = None,
+    ) -> np.ndarray:
+        fn, is_legacy, param_specs, accepts_kwargs = plan or self._get_process_block_plan()
+
+        if is_legacy:
             runtime = {
                 "node_id": ctx.node_id,
                 "execution_id": ctx.execution_id,
@@ -557,24 +589,18 @@ class BaseMapBlockNode:
             return fn(block, ctx.block_info, params, runtime)
 
         explicit_kwargs: Dict[str, Any] = {}
-        accepts_kwargs = False
 
-        for param in parameters[1:]:
-            if param.kind == inspect.Parameter.VAR_POSITIONAL:
-                continue
-            if param.kind == inspect.Parameter.VAR_KEYWORD:
-                accepts_kwargs = True
-                continue
-            if param.name == "ctx":
+        for name, has_default in param_specs:
+            if name == "ctx":
                 explicit_kwargs["ctx"] = ctx
                 continue
-            if param.name in params:
-                explicit_kwargs[param.name] = params[param.name]
+            if name in params:
+                explicit_kwargs[name] = params[name]
                 continue
-            if param.default is inspect.Parameter.empty:
+            if not has_default:
                 raise TypeError(
                     f"{type(self).__name__} PROCESS_BLOCK requires parameter "
-                    f"'{param.name}', but it was not provided by INPUT_TYPES."
+                    f"'{name}', but it was not provided by INPUT_TYPES."
                 )
 
         if accepts_kwargs:
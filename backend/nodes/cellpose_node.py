@@ -124,6 +124,8 @@ class DaskCellpose(BaseBlockMapNode):
     SKIP_EMPTY_BLOCKS = True
     SKIP_ALL_ZERO_BLOCKS = False
     OUTPUT_DTYPE = np.uint16
+    # model_name choices come from list_models(); re-read INPUT_TYPES per run
+    DYNAMIC_INPUTS = True
 
     @classmethod
     def INPUT_TYPES(cls):
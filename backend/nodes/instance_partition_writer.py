@@ -10,7 +10,6 @@ import scipy.ndimage as ndimage
 from core.registry import register_node
 from nodes.base import BaseBlockMapNode
 
-
 COLUMNS = [
     "chunk_id", "local_id",
     "centroid_z", "centroid_y", "centroid_x",
@@ -39,6 +38,21 @@ def _write_partition(df, path, file_format):
             os.remove(tmp)
 
 
+def _label_moments(block, n_labels):
+    """Voxel count and coordinate sums per label in a single pass over the block."""
+    flat = block.ravel()
+    fg = np.flatnonzero(flat > 0)
+    labels = flat[fg].astype(np.intp, copy=False)
+    z, y, x = np.unravel_index(fg, block.shape)
+    counts = np.bincount(labels, minlength=n_labels)
+    sums = np.stack([
+        np.bincount(labels, weights=z, minlength=n_labels),
+        np.bincount(labels, weights=y, minlength=n_labels),
+        np.bincount(labels, weights=x, minlength=n_labels),
+    ], axis=1)
+    return counts, sums
+
+
 def _extract_instances(block, origin, chunk_id):
     """Extract per-instance rows from a 3D mask block."""
     if block.ndim != 3 or block.size == 0:
@@ -50,6 +64,7 @@ def _extract_instances(block, origin, chunk_id):
         return pd.DataFrame(columns=COLUMNS)
 
     slices = ndimage.find_objects(block)
+    counts, sums = _label_moments(block, len(slices) + 1)
     shape = block.shape
     cur = [int(x) for x in chunk_id.split("_")]
     rows = []
@@ -59,15 +74,13 @@ def _extract_instances(block, origin, chunk_id):
         if idx - 1 >= len(slices) or slices[idx - 1] is None:
             continue
         sl = slices[idx - 1]
-        mask = block[sl] == idx
-        voxels = int(mask.sum())
+        voxels = int(counts[idx])
         if voxels == 0:
             continue
 
-        com = ndimage.center_of_mass(mask)
-        cz = float(origin[0] + sl[0].start + com[0])
-        cy = float(origin[1] + sl[1].start + com[1])
-        cx = float(origin[2] + sl[2].start + com[2])
+        cz = float(origin[0] + sums[idx, 0] / voxels)
+        cy = float(origin[1] + sums[idx, 1] / voxels)
+        cx = float(origin[2] + sums[idx, 2] / voxels)
 
         touches = (sl[0].start == 0 or sl[0].stop == shape[0]
                   or sl[1].start == 0 or sl[1].stop == shape[1]
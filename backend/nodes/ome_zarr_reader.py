@@ -1,4 +1,5 @@
 import os
+import json
 import logging
 import numpy as np
 import dask.array as da
@@ -23,16 +24,44 @@ class OMEZarrReader:
                 "chunk_y": ("INT", {"default": 64, "min": 1, "max": 1024, "label": "Y Chunk Size"}),
                 "chunk_x": ("INT", {"default": 64, "min": 1, "max": 1024, "label": "X Chunk Size"}),
                 "keep_first_dim": ("BOOLEAN", {"default": False, "label": "Keep First Dimension Intact"}),
+                "chunk_mb": ("INT", {"default": 0, "min": 0, "max": 4096, "label": "Auto Chunk Size (MiB, 0 = use Z/Y/X)"}),
             }
         }
 
     RETURN_TYPES = ("DASK_ARRAY", "DICT")
     RETURN_NAMES = ("dask_arr", "metadata")
     FUNCTION = "load_zarr"
+    EXECUTOR = "io"
+
+    @classmethod
+    def IS_CHANGED(cls, file_path="", **kwargs):
+        # Cache fingerprint for the executor: a rewritten store (the writer
+        # swaps whole directories) changes these mtimes, and so does an
+        # in-place rewrite of the dataset that load_zarr resolves to.
+        path = os.path.realpath(str(file_path).strip().strip('"').strip("'"))
+        names = ["", ".zattrs", ".zarray", ".zgroup", ".zmetadata"]
+        if not os.path.exists(os.path.join(path, ".zarray")):
+            names.append(os.path.join(cls._dataset_path_from_attrs(path), ".zarray"))
+        stamps = []
+        for name in names:
+            try:
+                stamps.append(os.stat(os.path.join(path, name)).st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    @staticmethod
+    def _dataset_path_from_attrs(path):
+        try:
+            with open(os.path.join(path, ".zattrs"), "r", encoding="utf-8") as f:
+                multiscales = json.load(f).get("multiscales", [])
+            return multiscales[0]["datasets"][0].get("path", "0")
+        except (OSError, ValueError, AttributeError, LookupError, TypeError):
+            return "0"
 
     def load_zarr(self, file_path,
                   chunk_z=64, chunk_y=64, chunk_x=64,
-                  keep_first_dim=False,
+                  keep_first_dim=False, chunk_mb=0,
                   callback=None, **kwargs):
         node_id = kwargs.get('_node_id', 'unknown')
 
@@ -49,19 +78,23 @@ class OMEZarrReader:
         dataset_path = None
         axes = None
         voxel_size = None
-        try:
+        # Decide array vs group from the metadata files on disk rather than a
+        # failing open_array probe; consolidated groups are read from one
+        # .zmetadata document.
+        if os.path.exists(os.path.join(file_path, ".zarray")):
             z_arr = zarr.open_array(file_path, mode='r')
-            array_path = file_path
             logger.info(f"[ZarrReader] Loaded direct array: {file_path}")
-        except Exception:
-            store = zarr.open_group(file_path, mode='r')
+        else:
+            if os.path.exists(os.path.join(file_path, ".zmetadata")):
+                store = zarr.open_consolidated(file_path, mode='r')
+            else:
+                store = zarr.open_group(file_path, mode='r')
             multiscales = store.attrs.get("multiscales", [])
             dataset_path = "0"
             if multiscales:
                 datasets = multiscales[0].get("datasets", [])
                 if datasets:
                     dataset_path = datasets[0].get("path", "0")
-            array_path = os.path.join(file_path, dataset_path)
             z_arr = store[dataset_path]
             logger.info(f"[ZarrReader] Loaded array from group, dataset={dataset_path}: {file_path}")
 
@@ -77,12 +110,19 @@ class OMEZarrReader:
         else:
             config_str = f"{chunk_z},{chunk_y},{chunk_x}"
 
-        target_chunks = self._parse_chunk_config(
-            config_str, shape, ndim, 512, keep_first_dim
-        )
+        if chunk_mb and chunk_mb > 0:
+            target_chunks = self._auto_chunks(z_arr, chunk_mb, keep_first_dim)
+        else:
+            target_chunks = self._parse_chunk_config(
+                config_str, shape, ndim, 512, keep_first_dim
+            )
         logger.info(f"[ZarrReader] Target chunks: {target_chunks}")
 
-        dask_arr = da.from_zarr(array_path, chunks=target_chunks)
+        # Storage chunks requested: let from_zarr take them as-is instead of
+        # normalizing an explicit chunk tuple.
+        chunks_arg = None if tuple(target_chunks) == tuple(z_arr.chunks) else target_chunks
+        # Reuse the opened array instead of letting from_zarr parse it again.
+        dask_arr = da.from_zarr(z_arr, chunks=chunks_arg)
         logger.info(f"[ZarrReader] Dask array: shape={dask_arr.shape}, chunks={dask_arr.chunksize}, npartitions={dask_arr.npartitions}")
 
         voxel_size = voxel_size or [1.0] * ndim
@@ -116,6 +156,30 @@ class OMEZarrReader:
         names = {2: ["Y", "X"], 3: ["Z", "Y", "X"], 4: ["C", "Z", "Y", "X"], 5: ["T", "C", "Z", "Y", "X"]}
         return names.get(ndim, [f"dim_{i}" for i in range(ndim)])
 
+    @staticmethod
+    def _auto_chunks(z_arr, chunk_mb, keep_first_dim):
+        """
+        Size dask chunks to roughly chunk_mb MiB as one integer multiple k of
+        the storage chunks (shards when the array has them) on every axis, so
+        each dask chunk reads whole zarr chunks.
+        """
+        shape = z_arr.shape
+        base = getattr(z_arr, "shards", None) or z_arr.chunks
+        keep = [i == 0 and keep_first_dim for i in range(len(shape))]
+        scaled = [i for i in range(len(shape)) if not keep[i]]
+        if not scaled:
+            return tuple(shape)
+
+        base_bytes = z_arr.dtype.itemsize
+        for i in range(len(shape)):
+            base_bytes *= shape[i] if keep[i] else base[i]
+        target_bytes = int(chunk_mb) * 1024 * 1024
+        k = max(1, round((target_bytes / base_bytes) ** (1 / len(scaled))))
+        return tuple(
+            shape[i] if keep[i] else min(shape[i], base[i] * k)
+            for i in range(len(shape))
+        )
+
     @staticmethod
     def _parse_chunk_config(config_str, array_shape, ndim, chunk_size, keep_first_dim):
         if not config_str or not config_str.strip():
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import os
 import shutil
+import threading
 import uuid
 
+import dask.array as da
 import numcodecs
 import numpy as np
 import zarr
@@ -108,23 +112,45 @@ def _normalize_axes_for_ngff(axes, ndim):
     return normalized
 
 
-def _prepare_compressor(compressor_name: str):
+BLOSC_SHUFFLES = {
+    "byte": numcodecs.Blosc.SHUFFLE,
+    "bit": numcodecs.Blosc.BITSHUFFLE,
+    "none": numcodecs.Blosc.NOSHUFFLE,
+}
+
+
+def _prepare_compressor(compressor_name: str, blosc_cname="lz4", blosc_clevel=5, blosc_shuffle="bit",
+                        blosc_blocksize=0):
     if compressor_name == "zstd":
         return numcodecs.Zstd(level=3)
-    if compressor_name == "blosc":
-        return numcodecs.Blosc(cname="zstd", clevel=3, shuffle=numcodecs.Blosc.SHUFFLE)
     if compressor_name == "lz4":
         return numcodecs.LZ4(acceleration=1)
     if compressor_name == "none":
         return None
-    return numcodecs.Zstd(level=3)
+    # Fixed presets, unchanged so saved graphs keep writing the same codec.
+    if compressor_name == "blosc":
+        return numcodecs.Blosc(cname="zstd", clevel=3, shuffle=numcodecs.Blosc.SHUFFLE)
+    if compressor_name == "blosc-lz4":
+        return numcodecs.Blosc(cname="lz4", clevel=1, shuffle=numcodecs.Blosc.BITSHUFFLE)
+    # default: Blosc configured by the blosc_* inputs. Their defaults give
+    # LZ4 + BITSHUFFLE: fast to decode, and bit-shuffle compresses float and
+    # 16-bit microscopy data better than byte-shuffle.
+    return numcodecs.Blosc(
+        cname=blosc_cname or "lz4",
+        clevel=int(blosc_clevel),
+        shuffle=BLOSC_SHUFFLES.get(blosc_shuffle, numcodecs.Blosc.BITSHUFFLE),
+        blocksize=int(blosc_blocksize or 0),
+    )
 
 
 def _normalize_output_path(output_path: str) -> str:
-    path = str(output_path or "output.zarr").strip().strip('"').strip("'")
+    path = str(output_path or "").strip().strip('"').strip("'") or "output.zarr"
     if "\x00" in path:
         raise ValueError("Output path contains a null byte.")
-    if not path.lower().endswith(".zarr"):
+    # normpath drops trailing separators, so "out.zarr/" stays "out.zarr"
+    # instead of becoming "out.zarr/.zarr".
+    path = os.path.normpath(path)
+    if os.path.splitext(path)[1].lower() != ".zarr":
         path += ".zarr"
     return os.path.abspath(path)
 
@@ -165,29 +191,71 @@ def _remove_path_best_effort(path: str | None) -> bool:
         return False
 
 
-def _init_zarr_store(abs_path, shape, chunks, dtype, compressor):
+def _init_zarr_store(abs_path, shape, chunks, dtype, compressor, level_shapes=()):
     if os.path.exists(abs_path):
         shutil.rmtree(abs_path)
     group = zarr.open_group(abs_path, mode="w")
-    group.create_dataset(
-        "0",
-        shape=tuple(int(x) for x in shape),
-        chunks=tuple(int(x) for x in chunks),
-        dtype=np.dtype(dtype),
-        compressor=compressor,
-        overwrite=True,
-    )
+    for level, level_shape in enumerate([shape, *level_shapes]):
+        group.create_dataset(
+            str(level),
+            shape=tuple(int(x) for x in level_shape),
+            chunks=tuple(min(int(c), int(x)) for c, x in zip(chunks, level_shape)),
+            dtype=np.dtype(dtype),
+            compressor=compressor,
+            overwrite=True,
+        )
     logger.info(
-        "[ZarrWriter] Store initialized: %s, shape=%s, chunks=%s, dtype=%s",
+        "[ZarrWriter] Store initialized: %s, shape=%s, chunks=%s, dtype=%s, levels=%d",
         abs_path,
         tuple(shape),
         tuple(chunks),
         np.dtype(dtype),
+        1 + len(level_shapes),
     )
 
 
-def _finalize_store(abs_path, ndim, metadata):
-    group = zarr.open(abs_path, mode="r+")
+def _downsample_type(dtype) -> str:
+    # Floating point levels are block means; integer data (labels, masks)
+    # takes every second voxel so ids stay valid.
+    return "mean" if np.issubdtype(np.dtype(dtype), np.floating) else "nearest"
+
+
+def _build_pyramid(dask_arr, levels, chunks):
+    """
+    Lazily downsample dask_arr into pyramid levels 1..levels, each built from
+    the previous one in the same graph, so they are computed and written by
+    the same tracked compute as level 0 (upstream blocks are shared, not
+    recomputed). Spatial axes (the last three) are halved, dropping an odd
+    trailing voxel; every level uses level 0's chunk shape, so coarse levels
+    have fewer chunk files rather than smaller ones.
+
+    Returns (arrays, factors): arrays[i] is level i + 1 and factors lists the
+    per-axis downsample factors of every level, level 0 included.
+    """
+    ndim = dask_arr.ndim
+    spatial = set(range(max(0, ndim - 3), ndim))
+    mean = _downsample_type(dask_arr.dtype) == "mean"
+    arrays, factors = [], [[1] * ndim]
+    src = dask_arr
+    for _ in range(int(levels)):
+        if any(src.shape[ax] < 2 for ax in spatial):
+            break
+        # Trim to even spatial extents and take 2x-chunk blocks, so each
+        # block halves to exactly one output chunk.
+        src = src[tuple(slice(0, src.shape[ax] // 2 * 2) if ax in spatial else slice(None) for ax in range(ndim))]
+        src = src.rechunk(tuple(2 * c if ax in spatial else c for ax, c in enumerate(chunks)))
+        if mean:
+            down = da.coarsen(np.mean, src, {ax: 2 for ax in spatial}).astype(dask_arr.dtype)
+        else:
+            down = src[tuple(slice(None, None, 2) if ax in spatial else slice(None) for ax in range(ndim))]
+        down = down.rechunk(tuple(min(c, s) for c, s in zip(chunks, down.shape)))
+        arrays.append(down)
+        factors.append([f * 2 if ax in spatial else f for ax, f in enumerate(factors[-1])])
+        src = down
+    return arrays, factors
+
+
+def _finalize_store(abs_path, ndim, metadata, level_factors=None, downsample_type="nearest"):
     axes = _normalize_axes_for_ngff(None, ndim)
     voxel_size = [1.0] * ndim
     if metadata:
@@ -196,16 +264,31 @@ def _finalize_store(abs_path, ndim, metadata):
         if metadata.get("voxel_size") and len(metadata["voxel_size"]) == ndim:
             voxel_size = metadata["voxel_size"]
 
-    group.attrs["multiscales"] = [{
+    multiscales = [{
         "version": "0.4",
         "name": "processed",
-        "datasets": [{
-            "path": "0",
-            "coordinateTransformations": [{"type": "scale", "scale": voxel_size}],
-        }],
+        "datasets": [
+            {
+                "path": str(level),
+                "coordinateTransformations": [{
+                    "type": "scale",
+                    "scale": [float(v) * f for v, f in zip(voxel_size, factors)],
+                }],
+            }
+            for level, factors in enumerate(level_factors or [[1] * ndim])
+        ],
         "axes": axes,
-        "type": "gaussian",
+        "type": downsample_type,
     }]
+    # open_group skips the array/group probing of zarr.open; a single
+    # attrs.update writes .zattrs once. The data is already stored at this
+    # point, so a metadata-only IO failure is logged instead of failing it.
+    try:
+        group = zarr.open_group(abs_path, mode="r+")
+        group.attrs.update({"multiscales": multiscales})
+    except (OSError, KeyError, json.JSONDecodeError) as exc:
+        logger.warning("[ZarrWriter] multiscales write failed for %s: %s", abs_path, exc)
+        return abs_path
     logger.info(
         "[ZarrWriter] OME-NGFF metadata written: %s axes=%s scale=%s",
         abs_path,
@@ -257,23 +340,48 @@ def _replace_final_with_temp(temp_path: str, final_path: str, overwrite: bool =
         ) from exc
 
     if backup_path and os.path.exists(backup_path):
-        if not _remove_path_best_effort(backup_path):
-            logger.warning(
-                "[ZarrWriter] Replacement succeeded but old-output backup remains: %s",
-                backup_path,
-            )
+        # The new output is already in place; deleting a large old store can
+        # take minutes, so do it off the executor's path. Not a daemon thread:
+        # interpreter exit waits for it instead of leaving a half-deleted tree.
+        threading.Thread(
+            target=_remove_backup,
+            args=(backup_path,),
+            name="zarr-backup-cleanup",
+            daemon=False,
+        ).start()
 
     return final_path
 
 
-def _write_token_block(block, temp_path, dataset_path, origins_per_dim, node_id, execution_id, block_info):
+def _remove_backup(backup_path: str) -> None:
+    if not _remove_path_best_effort(backup_path):
+        logger.warning(
+            "[ZarrWriter] Replacement succeeded but old-output backup remains: %s",
+            backup_path,
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _open_target_array(temp_path, dataset_path, write_empty_chunks):
+    # One opened array (and so one decoded Blosc codec) per worker process
+    # and store instead of re-reading .zarray for every block. Temp paths
+    # are unique per run, so stale entries are never written to again.
+    return zarr.open_array(
+        os.path.join(temp_path, dataset_path),
+        mode="r+",
+        write_empty_chunks=bool(write_empty_chunks),
+    )
+
+
+def _write_token_block(block, temp_path, dataset_path, origins_per_dim, node_id, execution_id,
+                       block_info, write_empty_chunks=False):
     """
     Write one block region to the temp zarr store and return a tiny uint8 token.
 
     The token array is intentionally tiny so the executor waits on write completion
     without materializing full-size image data.
     """
-    target = zarr.open(temp_path, mode="r+")[dataset_path]
+    target = _open_target_array(temp_path, dataset_path, bool(write_empty_chunks))
 
     # Extract chunk origin from block_info.
     # block_info is a dict with numeric keys (0, None) — the actual per-chunk info
@@ -354,6 +462,8 @@ class OMEZarrWriter:
     CATEGORY = "WorkFlow/IO"
     DISPLAY_NAME = "OME-Zarr Writer (Save)"
     OUTPUT_NODE = True
+    STATEFUL = True  # keeps per-run _writer_state; needs a fresh instance per call
+    EXECUTOR = "io"
 
     SKIP_EMPTY_BLOCKS = False
     SKIP_ALL_ZERO_BLOCKS = False
@@ -365,10 +475,16 @@ class OMEZarrWriter:
             "required": {
                 "dask_arr": ("DASK_ARRAY[any]",),
                 "output_path": ("STRING", {"default": "output.zarr", "multiline": False}),
-                "compressor_name": (["default", "zstd", "blosc", "lz4", "none"],),
+                "compressor_name": (["default", "zstd", "blosc", "blosc-lz4", "lz4", "none"],),
             },
             "optional": {
                 "metadata": ("DICT",),
+                "blosc_cname": (["lz4", "zstd", "blosclz", "zlib"], {"default": "lz4", "label": "Blosc Codec (default compressor only)"}),
+                "blosc_clevel": ("INT", {"default": 5, "min": 1, "max": 9, "label": "Blosc Level (default compressor only)"}),
+                "blosc_shuffle": (["bit", "byte", "none"], {"default": "bit", "label": "Blosc Shuffle (default compressor only)"}),
+                "blosc_blocksize": ("INT", {"default": 0, "min": 0, "max": 16777216, "label": "Blosc Block Size (bytes, 0 = auto; default compressor only)"}),
+                "write_empty_chunks": ("BOOLEAN", {"default": False, "label": "Write Empty Chunks"}),
+                "pyramid_levels": ("INT", {"default": 0, "min": 0, "max": 10, "label": "Pyramid Levels (0 = off)"}),
             },
         }
 
@@ -377,7 +493,8 @@ class OMEZarrWriter:
     FUNCTION = "save_zarr"
 
     def save_zarr(self, dask_arr, output_path="output.zarr", compressor_name="default",
-                   metadata=None, **kwargs):
+                   metadata=None, blosc_cname="lz4", blosc_clevel=5, blosc_shuffle="bit",
+                   blosc_blocksize=0, pyramid_levels=0, write_empty_chunks=False, **kwargs):
         """
         GraphBuilding phase — initialize writer state and return lazy token array.
 
@@ -389,7 +506,9 @@ class OMEZarrWriter:
         final_path = _normalize_output_path(output_path)
         temp_path = _make_temp_output_path(final_path)
         compressor_name = compressor_name or "default"
-        compressor = _prepare_compressor(compressor_name)
+        compressor = _prepare_compressor(
+            compressor_name, blosc_cname, blosc_clevel, blosc_shuffle, blosc_blocksize
+        )
         nominal_chunks = tuple(int(c) for c in dask_arr.chunksize)
         token_chunks = tuple((1,) * int(n) for n in dask_arr.numblocks)
         origins_per_dim = _chunk_origins_from_chunks(dask_arr.chunks)
@@ -397,6 +516,8 @@ class OMEZarrWriter:
 
         _validate_regular_chunks_for_region_writes(dask_arr.chunks)
 
+        pyramid, level_factors = _build_pyramid(dask_arr, pyramid_levels or 0, nominal_chunks)
+
         # Initialize the temp store during GraphBuilding.
         # The user-visible final path is not touched until all writes and
         # metadata finalization have succeeded.
@@ -406,6 +527,7 @@ class OMEZarrWriter:
             chunks=nominal_chunks,
             dtype=dask_arr.dtype,
             compressor=compressor,
+            level_shapes=[level.shape for level in pyramid],
         )
 
         # Store writer state for postprocess and cleanup
@@ -419,6 +541,9 @@ class OMEZarrWriter:
             "ndim": int(dask_arr.ndim),
             "metadata": metadata,
             "compressor_name": compressor_name,
+            "level_factors": level_factors,
+            "downsample_type": _downsample_type(dask_arr.dtype),
+            "write_empty_chunks": bool(write_empty_chunks),
             "overwrite": True,
         }
         self._preprocess_state = self._writer_state
@@ -437,6 +562,7 @@ class OMEZarrWriter:
 
         # map_blocks returns tiny uint8 tokens — executor waits on these tokens,
         # not on the full image data, to confirm writes completed.
+        name = f"OMEZarrWriter_{node_id}" if node_id else "OMEZarrWriter"
         tokens = dask_arr.map_blocks(
             _write_token_block,
             temp_path=temp_path,
@@ -444,12 +570,33 @@ class OMEZarrWriter:
             origins_per_dim=origins_per_dim,
             node_id=node_id,
             execution_id=execution_id,
+            write_empty_chunks=bool(write_empty_chunks),
             dtype=np.uint8,
             chunks=token_chunks,
             meta=np.array((), dtype=np.uint8),
-            name=f"OMEZarrWriter_{node_id}" if node_id else "OMEZarrWriter",
+            name=name,
         )
-        return (tokens,)
+        if not pyramid:
+            return (tokens,)
+
+        # Pyramid levels are written by the same compute, so they are tracked,
+        # cancellable and reported like level 0.
+        level_tokens = [tokens.reshape(-1)]
+        for level, level_arr in enumerate(pyramid, start=1):
+            level_tokens.append(level_arr.map_blocks(
+                _write_token_block,
+                temp_path=temp_path,
+                dataset_path=str(level),
+                origins_per_dim=_chunk_origins_from_chunks(level_arr.chunks),
+                node_id=node_id,
+                execution_id=execution_id,
+                write_empty_chunks=bool(write_empty_chunks),
+                dtype=np.uint8,
+                chunks=tuple((1,) * int(n) for n in level_arr.numblocks),
+                meta=np.array((), dtype=np.uint8),
+                name=f"{name}_level{level}",
+            ).reshape(-1))
+        return (da.concatenate(level_tokens),)
 
     def postprocess(self, outputs=None, state=None, runtime=None, **kwargs):
         """
@@ -478,7 +625,13 @@ class OMEZarrWriter:
                 "Writer state was not preserved from execute phase."
             )
 
-        _finalize_store(temp_path, ndim, metadata)
+        _finalize_store(
+            temp_path,
+            ndim,
+            metadata,
+            writer_state.get("level_factors"),
+            writer_state.get("downsample_type", "nearest"),
+        )
 
         return _replace_final_with_temp(
             temp_path=temp_path,
@@ -70,6 +70,8 @@ def stardist3d_block(
 class DaskStarDist3D(BaseBlockMapNode):
     CATEGORY = "WorkFlow/Segmentation"
     DISPLAY_NAME = "StarDist 3D"
+    # model_name choices come from list_models(); re-read INPUT_TYPES per run
+    DYNAMIC_INPUTS = True
 
     PROCESS_BLOCK = stardist3d_block
 
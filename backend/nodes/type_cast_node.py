@@ -13,12 +13,15 @@ def type_cast_block(block: np.ndarray, target_dtype: str, clip: bool) -> np.ndar
     if block.dtype == dtype:
         return block.astype(dtype, copy=False)
 
-    source = block
-    if clip and np.issubdtype(dtype, np.integer):
+    if clip and np.issubdtype(dtype, np.integer) and not np.can_cast(block.dtype, dtype, "safe"):
+        # Clip straight into the target buffer: one pass, no full-size
+        # intermediate in the source dtype.
         info = np.iinfo(dtype)
-        source = np.clip(source, info.min, info.max)
+        out = np.empty(block.shape, dtype=dtype)
+        np.clip(block, info.min, info.max, out=out, casting="unsafe")
+        return out
 
-    return source.astype(dtype, copy=False)
+    return block.astype(dtype, copy=False)
 
 
 @register_node("DaskTypeCast")
@@ -169,6 +169,17 @@ class WindowsMultiGPUPlugin(WorkerPlugin):
             logger.debug(f"Failed to bind GPU for worker {worker.name}, assigned={worker.assigned_gpu}: {e}")
 
 
+class BloscThreadingPlugin(WorkerPlugin):
+    def setup(self, worker):
+        """Keep Blosc single-threaded inside workers; Dask already parallelizes chunks."""
+        try:
+            import numcodecs.blosc as blosc
+            blosc.use_threads = False
+            blosc.set_nthreads(1)
+        except Exception as e:
+            logger.debug(f"Failed to configure Blosc threading on worker {worker.name}: {e}")
+
+
 # ==========================================
 # 配置 Dask 内存阈�?# ==========================================
 _memory_thresholds = _get_dask_memory_thresholds()
@@ -270,6 +281,10 @@ class DaskService:
                 )
                 self.client = Client(self.cluster)
 
+            # Read and write paths both decode/encode Blosc on workers; without
+            # this each worker thread would start a full-core codec pool.
+            self.client.register_plugin(BloscThreadingPlugin(), name="blosc_threading")
+
             if platform.system() == "Linux":
                 self.client.run_on_scheduler(
                     lambda dask_scheduler: dask_scheduler.loop.call_later(60, self._trim_memory))
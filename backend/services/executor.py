@@ -1,12 +1,18 @@
 import asyncio
+import copy
+import functools
 import inspect
 import logging
+import os
 import traceback
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 import dask
 from dask.base import is_dask_collection
-from distributed import wait as dist_wait
+from dask.sizeof import sizeof
 
 from core.registry import NODE_CLASS_MAPPINGS
 from core.state_manager import state_manager, ExecutionStatus
@@ -19,6 +25,24 @@ logger = logging.getLogger("BrainFlow.Executor")
 logging.getLogger("distributed.core").setLevel(logging.CRITICAL)
 logging.getLogger("distributed.utils").setLevel(logging.CRITICAL)
 
+# Upper bound on messages folded into a single "batch" WebSocket frame.
+WS_BATCH_MAX_ITEMS = 128
+# Minimum spacing between frames; updates arriving in between are coalesced.
+WS_BATCH_INTERVAL_S = 0.2
+# Concurrent GraphBuilding workers; enough to keep both node pools busy.
+MAX_NODE_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+# Node results kept across executions (least recently used are evicted).
+RESULT_CACHE_MAX_ENTRIES = 64
+# Approximate bytes those results may pin (mostly in-memory arrays embedded
+# in cached Dask graphs); larger outputs are not cached at all.
+RESULT_CACHE_MAX_BYTES = int(os.getenv("WorkFlow_RESULT_CACHE_MB", "512")) * 1024 * 1024
+
+# Synchronous node methods run on dedicated pools so long blocking I/O nodes
+# (EXECUTOR = "io") cannot starve graph-building nodes, and neither competes
+# with other run_in_executor(None, ...) users in the process.
+_CPU_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="brainflow-cpu")
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="brainflow-io")
+
 
 # =============================================================================
 # 1. Graph validation
@@ -79,14 +103,75 @@ def validate_graph_acyclic(graph: dict):
             dfs(node_id)
 
 
+# Per-class introspection results. INPUT_TYPES() is read once per class
+# unless the class sets DYNAMIC_INPUTS (e.g. model choices scanned from disk);
+# the FUNCTION signature is always read once.
+_INPUT_DEFS_CACHE: dict[type, dict] = {}
+_METHOD_CACHE: dict[type, tuple[str, bool, frozenset, bool]] = {}
+# Shared (instance, bound FUNCTION) per stateless node class. OUTPUT_NODE and
+# STATEFUL classes keep per-call state on the instance and are never shared.
+_INSTANCE_CACHE: dict[type, tuple[object, object]] = {}
+
+
 def _get_node_input_defs(node_cls) -> dict:
+    cached = _INPUT_DEFS_CACHE.get(node_cls)
+    if cached is not None:
+        return cached
     if not hasattr(node_cls, "INPUT_TYPES"):
         return {"required": {}, "optional": {}}
     try:
-        return node_cls.INPUT_TYPES()
+        input_defs = node_cls.INPUT_TYPES()
     except Exception as e:
         logger.warning(f"Failed to get INPUT_TYPES from {node_cls}: {e}")
         return {"required": {}, "optional": {}}
+    if getattr(node_cls, "DYNAMIC_INPUTS", False):
+        return input_defs
+    return _INPUT_DEFS_CACHE.setdefault(node_cls, input_defs)
+
+
+@functools.lru_cache(maxsize=None)
+def _method_params(func) -> tuple[frozenset, bool]:
+    """
+    Return (param_names, accepts_kwargs) for a plain function, read straight
+    from its code object; falls back to inspect.signature for other callables.
+    """
+    func = inspect.unwrap(func)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        sig = inspect.signature(func)
+        return (
+            frozenset(sig.parameters) - {"self"},
+            any(p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()),
+        )
+    names = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+    return frozenset(names) - {"self"}, bool(code.co_flags & inspect.CO_VARKEYWORDS)
+
+
+def _get_method_info(node_cls) -> tuple[str, bool, frozenset, bool]:
+    """
+    Return (method_name, is_coroutine, param_names, accepts_kwargs) for the
+    node's FUNCTION, introspecting the class attribute only once.
+    """
+    info = _METHOD_CACHE.get(node_cls)
+    if info is None:
+        method_name = getattr(node_cls, "FUNCTION", "execute")
+        func = getattr(node_cls, method_name)
+        params, accepts_kwargs = _method_params(getattr(func, "__func__", func))
+        info = (method_name, asyncio.iscoroutinefunction(func), params, accepts_kwargs)
+        _METHOD_CACHE[node_cls] = info
+    return info
+
+
+def _get_node_instance(node_cls, method_name: str):
+    """Return (instance, bound method) for a node call."""
+    entry = _INSTANCE_CACHE.get(node_cls)
+    if entry is not None:
+        return entry
+    instance = node_cls()
+    entry = (instance, getattr(instance, method_name))
+    if getattr(node_cls, "STATEFUL", False) or getattr(node_cls, "OUTPUT_NODE", False):
+        return entry
+    return _INSTANCE_CACHE.setdefault(node_cls, entry)
 
 
 def _get_declared_input_type(node_cls, input_name: str):
@@ -185,64 +270,118 @@ def validate_graph_types(graph: dict):
 # =============================================================================
 # 2. Input preparation
 # =============================================================================
-def validate_and_prepare_inputs(node_cls, raw_inputs, node_id="Unknown"):
-    final_inputs = {}
-    if hasattr(node_cls, "INPUT_TYPES"):
-        try:
-            input_defs = node_cls.INPUT_TYPES()
-        except Exception as e:
-            logger.warning(f"Failed to get INPUT_TYPES from {node_cls}: {e}")
-            input_defs = {"required": {}, "optional": {}}
-    else:
-        input_defs = {"required": {}, "optional": {}}
+_MISSING = object()
+_VALIDATION_PLAN: dict[type, "ValidationPlan"] = {}
 
-    for name, config in input_defs.get("required", {}).items():
-        val = raw_inputs.get(name)
-        input_type = config[0]
-        meta = config[1] if len(config) > 1 and isinstance(config[1], dict) else {}
 
-        is_enum_or_list = isinstance(input_type, list) and len(input_type) > 0
+def _coerce_int(val):
+    return int(float(val))
 
-        if val is None or (isinstance(val, str) and val == ""):
+
+def _coerce_bool(val):
+    if isinstance(val, str):
+        return val.lower() == "true"
+    return bool(val)
+
+
+# input type -> (converter, Python type that needs no conversion)
+_COERCERS = {"INT": (_coerce_int, int), "FLOAT": (float, float), "BOOLEAN": (_coerce_bool, bool)}
+
+
+@dataclass(frozen=True)
+class ValidationPlan:
+    """Per-class INPUT_TYPES digest used by validate_and_prepare_inputs."""
+    names: frozenset      # every declared input
+    defaults: dict        # name -> fallback, for inputs that have one
+    fallbacks: tuple      # (name, fallback, required): None (and "" if required) -> fallback
+    required: tuple       # (name, input_type) that must end up non-empty
+    coercers: tuple       # (name, converter, py_type) for INT/FLOAT/BOOLEAN inputs
+
+
+def _get_validation_plan(node_cls) -> ValidationPlan:
+    """
+    Flatten INPUT_TYPES into a ValidationPlan. The fallback for an input is
+    its meta default, or the first choice of a required enum input.
+    """
+    plan = _VALIDATION_PLAN.get(node_cls)
+    if plan is not None:
+        return plan
+
+    input_defs = _get_node_input_defs(node_cls)
+    names, defaults, fallbacks, required_items, coercers = [], {}, [], [], []
+    for section in ("required", "optional"):
+        required = section == "required"
+        for name, config in input_defs.get(section, {}).items():
+            input_type = config[0]
+            meta = config[1] if len(config) > 1 and isinstance(config[1], dict) else {}
             if "default" in meta:
-                val = meta["default"]
-            elif is_enum_or_list:
-                val = input_type[0]
+                fallback = meta["default"]
+            elif required and isinstance(input_type, list) and len(input_type) > 0:
+                fallback = input_type[0]
+            else:
+                fallback = _MISSING
+            names.append(name)
+            if fallback is not _MISSING:
+                defaults[name] = fallback
+                fallbacks.append((name, fallback, required))
+            if required:
+                required_items.append((name, input_type))
+            coercer = _COERCERS.get(input_type) if isinstance(input_type, str) else None
+            if coercer is not None:
+                coercers.append((name, *coercer))
+
+    plan = ValidationPlan(
+        names=frozenset(names),
+        defaults=defaults,
+        fallbacks=tuple(fallbacks),
+        required=tuple(required_items),
+        coercers=tuple(coercers),
+    )
+    # Only keep plans built from cached INPUT_TYPES; a failing INPUT_TYPES()
+    # is retried (and logged) on the next call, as before, and DYNAMIC_INPUTS
+    # classes get a fresh plan (enum choices and fallback) every call.
+    if node_cls in _INPUT_DEFS_CACHE or not hasattr(node_cls, "INPUT_TYPES"):
+        _VALIDATION_PLAN[node_cls] = plan
+    return plan
+
 
+def validate_and_prepare_inputs(node_cls, raw_inputs, node_id="Unknown"):
+    plan = _get_validation_plan(node_cls)
+    final_inputs = {**plan.defaults, **raw_inputs}
+    if final_inputs.keys() != plan.names:
+        # Drop undeclared keys and give declared-but-absent inputs None.
+        final_inputs = {name: final_inputs.get(name) for name in plan.names}
+
+    for name, fallback, required in plan.fallbacks:
+        val = final_inputs[name]
+        if val is None or (required and isinstance(val, str) and val == ""):
+            final_inputs[name] = fallback
+
+    for name, input_type in plan.required:
+        val = final_inputs[name]
         if val is None or (isinstance(val, str) and val == ""):
             if input_type == "STRING":
                 raise ValueError(f"Required input '{name}' is missing for Node {node_id}.")
-            else:
-                raise ValueError(
-                    f"Required input '{name}' is missing for Node {node_id} "
-                    f"(type={input_type}, received={val!r})."
-                )
-        final_inputs[name] = val
-
-    for name, config in input_defs.get("optional", {}).items():
-        val = raw_inputs.get(name)
-        meta = config[1] if len(config) > 1 and isinstance(config[1], dict) else {}
-        if val is None and "default" in meta:
-            val = meta["default"]
-        final_inputs[name] = val
+            raise ValueError(
+                f"Required input '{name}' is missing for Node {node_id} "
+                f"(type={input_type}, received={val!r})."
+            )
 
-    for name, val in final_inputs.items():
+    for name, coerce, py_type in plan.coercers:
+        val = final_inputs[name]
+        if type(val) is py_type:
+            continue
+        # bool is an int subclass; int(True) == 1 would hide a wiring mistake.
+        if isinstance(val, bool):
+            raise ValueError(
+                f"Input '{name}' for Node {node_id} expects {py_type.__name__}, "
+                f"got boolean {val!r}."
+            )
         if val is not None and isinstance(val, (str, int, float)):
-            def_info = input_defs.get("required", {}).get(name) or input_defs.get("optional", {}).get(name)
-            if def_info:
-                target_type = def_info[0]
-                try:
-                    if target_type == "INT":
-                        final_inputs[name] = int(float(val))
-                    elif target_type == "FLOAT":
-                        final_inputs[name] = float(val)
-                    elif target_type == "BOOLEAN":
-                        if isinstance(val, str):
-                            final_inputs[name] = val.lower() == "true"
-                        else:
-                            final_inputs[name] = bool(val)
-                except Exception as e:
-                    logger.warning(f"Failed to convert input {name}: {e}")
+            try:
+                final_inputs[name] = coerce(val)
+            except Exception as e:
+                logger.warning(f"Failed to convert input {name}: {e}")
     return final_inputs
 
 
@@ -297,15 +436,299 @@ def _extract_compute_collection(item):
     return None
 
 
+async def _wait_futures(futures):
+    """
+    Await distributed futures without parking a thread in distributed.wait().
+
+    Each future's done-callback (fired from the client's thread on success,
+    error or cancellation) hops back onto the event loop; the returned
+    awaitable resolves once all of them have finished.
+    """
+    loop = asyncio.get_running_loop()
+    all_done = loop.create_future()
+    pending = len(futures)
+    if pending == 0:
+        return
+
+    def mark_done():
+        nonlocal pending
+        pending -= 1
+        if pending == 0 and not all_done.done():
+            all_done.set_result(None)
+
+    def on_done(_future):
+        try:
+            loop.call_soon_threadsafe(mark_done)
+        except RuntimeError:
+            pass  # loop already closed; nobody is waiting any more
+
+    for future in futures:
+        future.add_done_callback(on_done)
+    await all_done
+
+
+# =============================================================================
+# 4. Batched WebSocket delivery
+# =============================================================================
+_SENDER_STOP = object()
+
+
+def _coalesce_progress(items: list) -> list:
+    """
+    Drop progress messages superseded by a later one for the same node in the
+    same runState. The last message of each runState is always kept, so
+    transitions such as Submitted -> Running reach the client in order.
+    """
+    keep = [True] * len(items)
+    next_state = {}
+    for i in range(len(items) - 1, -1, -1):
+        item = items[i]
+        if item.get("type") != "progress":
+            continue
+        task_id = item.get("taskId")
+        run_state = item.get("runState")
+        if task_id in next_state and next_state[task_id] == run_state:
+            keep[i] = False
+        next_state[task_id] = run_state
+    return [item for i, item in enumerate(items) if keep[i]]
+
+
+async def _ws_sender(execution_id: str, queue: asyncio.Queue):
+    """
+    Drain queued execution messages and broadcast them as batch frames.
+
+    Every wakeup takes one message, waits out the rest of
+    WS_BATCH_INTERVAL_S since the previous frame, then drains whatever else
+    is queued (up to WS_BATCH_MAX_ITEMS). Superseded progress updates for the
+    same node and runState are dropped and the rest is sent as a single
+    {"type": "batch", "items": [...]} frame; a lone message is sent as-is.
+    Putting _SENDER_STOP on the queue flushes pending messages and exits.
+    """
+    loop = asyncio.get_running_loop()
+    last_sent = 0.0
+    while True:
+        msg = await queue.get()
+        stop = msg is _SENDER_STOP
+        items = [] if stop else [msg]
+        if not stop:
+            delay = last_sent + WS_BATCH_INTERVAL_S - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        while not stop and len(items) < WS_BATCH_MAX_ITEMS:
+            try:
+                more = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if more is _SENDER_STOP:
+                stop = True
+            else:
+                items.append(more)
+
+        items = _coalesce_progress(items)
+        if len(items) == 1:
+            await state_manager.broadcast(execution_id, items[0])
+        elif items:
+            await state_manager.broadcast(execution_id, {"type": "batch", "items": items})
+        last_sent = loop.time()
+        if stop:
+            return
+
+
 # =============================================================================
-# 4. Core executor
+# 5. Core executor
 # =============================================================================
+# Node outputs memoized across executions, keyed by node identity, the
+# fingerprint of its literal inputs and the cache keys of the upstream nodes
+# feeding it (Merkle-style). Dask collection names are not used: map-block
+# nodes name their output after the node id, not after its inputs.
+# Values are (output, approximate nbytes).
+_RESULT_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_RESULT_CACHE_BYTES = 0
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _hash_val(val):
+    if val is None or isinstance(val, (str, int, float, bool)):
+        return val
+    if isinstance(val, dict):
+        return ("dict", tuple(sorted((str(k), _hash_val(v)) for k, v in val.items())))
+    if isinstance(val, (list, tuple)):
+        return (type(val).__name__, tuple(_hash_val(v) for v in val))
+    raise _Uncacheable(type(val).__name__)
+
+
+def _result_cache_key(node_cls, class_name: str, node_id: str, func_args: dict, upstream: dict):
+    """
+    Build the memoization key for a node call, or None when the node opts out
+    (NO_CACHE / OUTPUT_NODE), an upstream node is uncacheable or an input
+    cannot be fingerprinted.
+
+    ``upstream`` maps each linked input name to (upstream cache key, output
+    slot); those inputs are identified by that pair instead of their value.
+    Nodes that read external state may define an ``IS_CHANGED`` classmethod;
+    its return value is folded into the key so a changed source invalidates it.
+    """
+    if getattr(node_cls, "NO_CACHE", False) or getattr(node_cls, "OUTPUT_NODE", False):
+        return None
+    if any(src_key is None for src_key, _ in upstream.values()):
+        return None
+    inputs = {k: v for k, v in func_args.items() if not k.startswith("_")}
+    literals = {k: v for k, v in inputs.items() if k not in upstream}
+    try:
+        key = [class_name, node_id, _hash_val(literals), tuple(sorted(upstream.items()))]
+        is_changed = getattr(node_cls, "IS_CHANGED", None)
+        if is_changed is not None:
+            key.append(_hash_val(is_changed(**inputs)))
+        key = tuple(key)
+        hash(key)
+    except Exception as e:
+        logger.debug(f"Node {node_id} ({class_name}) is not cacheable: {e}")
+        return None
+    return key
+
+
+def _copy_output(output: tuple) -> tuple:
+    # Dask collections are immutable; metadata dicts are not, and downstream
+    # nodes must not be able to edit a cached entry through them.
+    return tuple(copy.deepcopy(item) if isinstance(item, (dict, list)) else item for item in output)
+
+
+def _output_nbytes(output: tuple) -> int:
+    total = 0
+    for item in output:
+        if _is_dask_collection(item):
+            total += sum(sizeof(v) for v in item.__dask_graph__().values())
+        else:
+            total += sizeof(item)
+    return total
+
+
+def _result_cache_get(key):
+    entry = _RESULT_CACHE.get(key)
+    if entry is None:
+        return None
+    _RESULT_CACHE.move_to_end(key)
+    return _copy_output(entry[0])
+
+
+def _result_cache_clear():
+    global _RESULT_CACHE_BYTES
+    _RESULT_CACHE.clear()
+    _RESULT_CACHE_BYTES = 0
+
+
+def _result_cache_put(key, output):
+    global _RESULT_CACHE_BYTES
+    nbytes = _output_nbytes(output)
+    if nbytes > RESULT_CACHE_MAX_BYTES:
+        return
+    old = _RESULT_CACHE.pop(key, None)
+    if old is not None:
+        _RESULT_CACHE_BYTES -= old[1]
+    _RESULT_CACHE[key] = (_copy_output(output), nbytes)
+    _RESULT_CACHE_BYTES += nbytes
+    while len(_RESULT_CACHE) > RESULT_CACHE_MAX_ENTRIES or _RESULT_CACHE_BYTES > RESULT_CACHE_MAX_BYTES:
+        _, (_, evicted) = _RESULT_CACHE.popitem(last=False)
+        _RESULT_CACHE_BYTES -= evicted
+
+
+_UNSET = object()
+
+
+@dataclass(frozen=True)
+class CompiledNode:
+    """Flat, pre-validated view of one graph node's type and inputs."""
+    node_id: str
+    class_name: str
+    edge_keys: tuple      # input names fed by upstream outputs
+    edge_src: tuple       # upstream node index per edge
+    edge_idx: tuple       # upstream output slot per edge
+    literal_items: tuple  # (input name, value) pairs set in the graph
+
+
+def _compile_graph(graph: dict) -> tuple[list, dict]:
+    """
+    Number the nodes 0..N-1 and split every node's inputs into edge and
+    literal lists once, so the execution loop does no isinstance checks,
+    nested dict lookups or string hashing.
+
+    Returns (nodes, id_to_idx): nodes[i] is the CompiledNode for the i-th
+    node and id_to_idx maps graph node ids back to that index.
+    """
+    id_to_idx = {node_id: i for i, node_id in enumerate(graph)}
+    nodes = []
+    for node_id, node_data in graph.items():
+        edge_keys, edge_src, edge_idx, literal_items = [], [], [], []
+        for k, v in node_data.get("inputs", {}).items():
+            if not (isinstance(v, list) and len(v) == 2):
+                literal_items.append((k, v))
+                continue
+            dep_id, raw_idx = v
+            try:
+                slot_idx = int(raw_idx)
+            except (ValueError, TypeError):
+                raise ValueError(
+                    f"Node '{node_id}': invalid output slot index {raw_idx!r} "
+                    f"(source '{dep_id}'). Must be a non-negative integer."
+                )
+            if slot_idx < 0:
+                raise ValueError(
+                    f"Node '{node_id}': negative output slot index {slot_idx} "
+                    f"(source '{dep_id}'). Must be a non-negative integer."
+                )
+            edge_keys.append(k)
+            edge_src.append(id_to_idx[dep_id])
+            edge_idx.append(slot_idx)
+        nodes.append(CompiledNode(
+            node_id=node_id,
+            class_name=node_data["type"],
+            edge_keys=tuple(edge_keys),
+            edge_src=tuple(edge_src),
+            edge_idx=tuple(edge_idx),
+            literal_items=tuple(literal_items),
+        ))
+    return nodes, id_to_idx
+
+
+def _plan_execution(nodes: list, output_idx: list) -> tuple[list, list, list]:
+    """
+    Collect the nodes OUTPUT_NODEs depend on and index their edges.
+
+    Returns (needed, in_degree, dependents), all by node index: needed lists
+    the nodes to execute, in_degree[i] is the number of distinct upstream
+    nodes and dependents[i] lists the nodes that consume node i's outputs.
+    Nodes no output depends on are not executed.
+    """
+    n = len(nodes)
+    in_degree = [0] * n
+    dependents = [[] for _ in range(n)]
+    seen = [False] * n
+    needed = []
+    stack = list(output_idx)
+    while stack:
+        idx = stack.pop()
+        if seen[idx]:
+            continue
+        seen[idx] = True
+        needed.append(idx)
+        deps = set(nodes[idx].edge_src)
+        in_degree[idx] = len(deps)
+        for dep in deps:
+            dependents[dep].append(idx)
+        stack.extend(deps)
+    return needed, in_degree, dependents
+
+
 async def execute_graph(graph: dict, execution_id: str = None):
     """
     Two-phase executor:
 
-    Phase 1 (GraphBuilding): recursively executes all OUTPUT_NODE dependencies,
-    building a lazy Dask graph. No Dask compute happens here.
+    Phase 1 (GraphBuilding): executes all OUTPUT_NODE dependencies in
+    topological order, building a lazy Dask graph. Nodes whose inputs are
+    ready run concurrently. No Dask compute happens here.
 
     Phase 2 (Compute): discovers Dask collections from OUTPUT_NODE return values.
     If any are found, submits them in a single client.compute([...]) call.
@@ -314,26 +737,48 @@ async def execute_graph(graph: dict, execution_id: str = None):
     """
     tasks = {}
     sink_futures = []
+    results = []
+    node_instances = {}
     client = None
     should_cancel_dask_objects = False
 
     if not execution_id:
         execution_id = uuid.uuid4().hex
 
+    loop = asyncio.get_running_loop()
     mem_monitor = get_memory_monitor()
     mem_monitor.snapshots.clear()
 
+    async def log_memory(name: str):
+        # psutil and client.run block on syscalls / worker round trips.
+        await loop.run_in_executor(_IO_POOL, lambda: mem_monitor.log_snapshot(name, client=client))
+
     session = state_manager.create_execution(execution_id)
 
+    # Non-terminal messages go through a queue so bursts of progress updates
+    # leave as a few batch frames; terminal messages flush the queue first.
+    out_queue: asyncio.Queue = asyncio.Queue()
+    sender_task = asyncio.create_task(_ws_sender(execution_id, out_queue))
+
+    def emit(message: dict):
+        message.setdefault("executionId", execution_id)
+        out_queue.put_nowait(message)
+
+    async def flush_messages():
+        if not sender_task.done():
+            out_queue.put_nowait(_SENDER_STOP)
+            await sender_task
+
     try:
         client = dask_service.get_client()
         validate_graph_structure(graph)
         validate_graph_acyclic(graph)
         validate_graph_types(graph)
+        compiled, id_to_idx = _compile_graph(graph)
 
-        mem_monitor.log_snapshot("execution_start", client=client)
+        await log_memory("execution_start")
 
-        await state_manager.broadcast(execution_id, {
+        emit({
             "type": "log",
             "message": "Engine Started...",
             "executionId": execution_id,
@@ -347,6 +792,7 @@ async def execute_graph(graph: dict, execution_id: str = None):
         ]
         if not output_nodes:
             state_manager.set_execution_status(execution_id, ExecutionStatus.FAILED)
+            await flush_messages()
             await state_manager.broadcast(execution_id, {
                 "type": "execution_finished",
                 "executionId": execution_id,
@@ -356,18 +802,19 @@ async def execute_graph(graph: dict, execution_id: str = None):
             state_manager.add_log("No output node found. Cannot execute.", "error", execution_id=execution_id)
             return execution_id
 
-        results = {}
-        node_instances = {}
-        loop = asyncio.get_running_loop()
+        results = [_UNSET] * len(compiled)
+        # Result cache key per node index (None = not cacheable); downstream
+        # keys are built from these.
+        cache_keys = [None] * len(compiled)
 
-        async def progress_callback(
+        def progress_callback(
             node_id: str,
             progress: int | None = None,
             message: str = "",
             run_state: str = "ready",
         ):
-            node_data = graph.get(node_id)
-            NodeCls = NODE_CLASS_MAPPINGS.get(node_data.get("type")) if node_data else None
+            idx = id_to_idx.get(node_id)
+            NodeCls = NODE_CLASS_MAPPINGS.get(compiled[idx].class_name) if idx is not None else None
             pt_value = "state_only"
             device = None
             if NodeCls:
@@ -400,103 +847,81 @@ async def execute_graph(graph: dict, execution_id: str = None):
             }
             if device:
                 broadcast_msg["device"] = device
-            await state_manager.broadcast(execution_id, broadcast_msg)
+            emit(broadcast_msg)
 
-        async def _compute_node(node_id: str):
+        async def _compute_node(idx: int):
+            node = compiled[idx]
+            node_id = node.node_id
             NodeCls = None
             class_name = None
             func_args = None
 
             try:
-                await progress_callback(node_id, None, "Initializing...", "ready")
-                node_data = graph.get(node_id)
-                class_name = node_data["type"]
-
-                pending_inputs = {}
-                final_inputs = {}
+                progress_callback(node_id, None, "Initializing...", "ready")
+                class_name = node.class_name
+                final_inputs = dict(node.literal_items)
                 upstream_metadatas = []
 
-                for k, v in node_data.get("inputs", {}).items():
-                    if isinstance(v, list) and len(v) == 2:
-                        pending_inputs[k] = (v[0], v[1])
-                    else:
-                        final_inputs[k] = v
-
-                dep_ids = list(set([x[0] for x in pending_inputs.values()]))
-                if dep_ids:
-                    await asyncio.gather(*(schedule_node(dep_id) for dep_id in dep_ids))
-
-                for arg_name, raw_slot_idx in pending_inputs.items():
-                    dep_id, raw_idx = raw_slot_idx
-                    try:
-                        slot_idx = int(raw_idx)
-                    except (ValueError, TypeError):
-                        raise ValueError(
-                            f"Node '{node_id}': invalid output slot index {raw_idx!r} "
-                            f"(source '{dep_id}'). Must be a non-negative integer."
-                        )
-                    if slot_idx < 0:
+                for arg_name, dep, slot_idx in zip(node.edge_keys, node.edge_src, node.edge_idx):
+                    src_result = results[dep]
+                    if slot_idx >= len(src_result):
                         raise ValueError(
-                            f"Node '{node_id}': negative output slot index {slot_idx} "
-                            f"(source '{dep_id}'). Must be a non-negative integer."
+                            f"Node '{node_id}': output slot {slot_idx} out of range "
+                            f"(source '{compiled[dep].node_id}' has {len(src_result)} slots)."
                         )
-
-                    src_result = results[dep_id]
-                    val = None
-                    if isinstance(src_result, tuple):
-                        if slot_idx >= len(src_result):
-                            raise ValueError(
-                                f"Node '{node_id}': output slot {slot_idx} out of range "
-                                f"(source '{dep_id}' has {len(src_result)} slots)."
-                            )
-                        val = src_result[slot_idx]
-                        for item in src_result:
-                            if isinstance(item, dict) and ("axes" in item or "source_path" in item):
-                                upstream_metadatas.append(item)
-                    else:
-                        if slot_idx != 0:
-                            raise ValueError(
-                                f"Node '{node_id}': output slot {slot_idx} out of range "
-                                f"(source '{dep_id}' has 1 slot)."
-                            )
-                        val = src_result
-                    final_inputs[arg_name] = val
+                    final_inputs[arg_name] = src_result[slot_idx]
+                    for item in src_result:
+                        if isinstance(item, dict) and ("axes" in item or "source_path" in item):
+                            upstream_metadatas.append(item)
 
                 NodeCls = NODE_CLASS_MAPPINGS.get(class_name)
                 if NodeCls is None:
                     raise ValueError(f"Node class '{class_name}' not found.")
 
                 func_args = validate_and_prepare_inputs(NodeCls, final_inputs, node_id)
+                upstream = {
+                    arg_name: (cache_keys[dep], slot_idx)
+                    for arg_name, dep, slot_idx in zip(node.edge_keys, node.edge_src, node.edge_idx)
+                }
+                cache_key = _result_cache_key(NodeCls, class_name, node_id, func_args, upstream)
+                cache_keys[idx] = cache_key
+                cached = _result_cache_get(cache_key) if cache_key is not None else None
+                if cached is not None:
+                    logger.info(f"Node {node_id} ({class_name}): inputs unchanged, reusing cached result")
+                    is_lazy = any(_is_dask_collection(item) for item in cached)
+                    if is_lazy:
+                        progress_callback(node_id, None, "Ready (cached)", "ready")
+                    else:
+                        progress_callback(node_id, 100, "Done (cached)", "done")
+                    results[idx] = cached
+                    return cached
+
                 func_args["_node_id"] = node_id
                 func_args["_execution_id"] = execution_id
 
-                # Instantiate FIRST, then get method from the instance
-                instance = NodeCls()
+                method_name, is_coroutine, params, accepts_kwargs = _get_method_info(NodeCls)
+                instance, method = _get_node_instance(NodeCls, method_name)
                 node_instances[node_id] = instance
 
-                method_name = getattr(NodeCls, "FUNCTION", "execute")
-                method = getattr(instance, method_name)
-
-                if "callback" in inspect.signature(method).parameters:
+                if "callback" in params:
                     func_args.pop("callback", None)
-                if "global_progress_callback" in inspect.signature(method).parameters:
+                if "global_progress_callback" in params:
                     func_args.pop("global_progress_callback", None)
 
                 # Filter _node_id / _execution_id for methods that don't accept **kwargs
-                sig = inspect.signature(method)
-                accepts_kwargs = any(
-                    p.kind == inspect.Parameter.VAR_KEYWORD
-                    for p in sig.parameters.values()
-                )
                 if not accepts_kwargs:
-                    filtered = {k: v for k, v in func_args.items() if k in sig.parameters}
-                    func_args = filtered
+                    func_args = {k: v for k, v in func_args.items() if k in params}
 
                 with dask.annotate(brainflow_node_id=node_id):
-                    if asyncio.iscoroutinefunction(method):
+                    if is_coroutine:
                         output = await method(**func_args)
                     else:
-                        output = await loop.run_in_executor(None, lambda: method(**func_args))
+                        pool = _IO_POOL if getattr(NodeCls, "EXECUTOR", "cpu") == "io" else _CPU_POOL
+
+                        def _call():
+                            return method(**func_args)
+
+                        output = await loop.run_in_executor(pool, _call)
 
                 output_list = list(output if isinstance(output, tuple) else (output,))
 
@@ -507,12 +932,14 @@ async def execute_graph(graph: dict, execution_id: str = None):
                     output = tuple(output_list)
 
                 if is_lazy:
-                    await progress_callback(node_id, None, "Ready", "ready")
+                    progress_callback(node_id, None, "Ready", "ready")
                 else:
-                    await progress_callback(node_id, 100, "Done", "done")
+                    progress_callback(node_id, 100, "Done", "done")
 
-                results[node_id] = output if isinstance(output, tuple) else (output,)
-                return results[node_id]
+                results[idx] = output if isinstance(output, tuple) else (output,)
+                if cache_key is not None:
+                    _result_cache_put(cache_key, results[idx])
+                return results[idx]
 
             except Exception as e:
                 error_context = {
@@ -536,31 +963,51 @@ async def execute_graph(graph: dict, execution_id: str = None):
                     extra=error_context,
                 )
                 traceback.print_exc()
-                await progress_callback(node_id, None, f"Error: {error_context['error_type']}", "failed")
+                progress_callback(node_id, None, f"Error: {error_context['error_type']}", "failed")
                 raise e
 
-        async def schedule_node(node_id: str):
-            if node_id in results:
-                return results[node_id]
-            if node_id in tasks:
-                return await tasks[node_id]
-            task = asyncio.create_task(_compute_node(node_id))
-            tasks[node_id] = task
-            return await task
+        needed, in_degree, dependents = _plan_execution(
+            compiled, [id_to_idx[nid] for nid in output_nodes]
+        )
+        ready: asyncio.Queue = asyncio.Queue()
+        for idx in needed:
+            if in_degree[idx] == 0:
+                ready.put_nowait(idx)
+        remaining = len(needed)
+        n_workers = min(remaining, MAX_NODE_WORKERS)
+
+        async def node_worker():
+            # Pull ready nodes; release dependents whose last input just finished.
+            nonlocal remaining
+            while True:
+                idx = await ready.get()
+                if idx is None:
+                    return
+                await _compute_node(idx)
+                remaining -= 1
+                for child in dependents[idx]:
+                    in_degree[child] -= 1
+                    if in_degree[child] == 0:
+                        ready.put_nowait(child)
+                if remaining == 0:
+                    for _ in range(n_workers):
+                        ready.put_nowait(None)
 
         # =========================================================================
         # Phase 1: GraphBuilding
         # =========================================================================
-        await state_manager.broadcast(execution_id, {"type": "log", "message": "GraphBuilding..."})
+        emit({"type": "log", "message": "GraphBuilding..."})
         state_manager.add_log("GraphBuilding...", "info", execution_id=execution_id)
-        await asyncio.gather(*(schedule_node(nid) for nid in output_nodes))
+        for i in range(n_workers):
+            tasks[f"worker-{i}"] = asyncio.create_task(node_worker())
+        await asyncio.gather(*tasks.values())
 
         # =========================================================================
         # Phase 2: Collect OUTPUT collections and compute
         # =========================================================================
         output_sinks = []
         for nid in output_nodes:
-            node_result = results.get(nid)
+            node_result = results[id_to_idx[nid]]
             found_for_node = False
             for idx, item in enumerate(_iter_output_items(node_result)):
                 collection = _extract_compute_collection(item)
@@ -598,7 +1045,7 @@ async def execute_graph(graph: dict, execution_id: str = None):
 
             # Send submitted state for all output nodes
             for nid in output_nodes:
-                await progress_callback(nid, None, "Submitted", "submitted")
+                progress_callback(nid, None, "Submitted", "submitted")
 
             collections = [s["collection"] for s in output_sinks]
             futures = client.compute(collections)
@@ -606,7 +1053,7 @@ async def execute_graph(graph: dict, execution_id: str = None):
                 futures = [futures]
             sink_futures.extend(futures)
 
-            await state_manager.broadcast(execution_id, {
+            emit({
                 "type": "log",
                 "message": f"Submitted {len(output_sinks)} sink(s) — Computing...",
             })
@@ -618,10 +1065,10 @@ async def execute_graph(graph: dict, execution_id: str = None):
 
             # Send running state for all output nodes
             for nid in output_nodes:
-                await progress_callback(nid, None, "Running", "running")
+                progress_callback(nid, None, "Running", "running")
 
             # Wait for all futures; this does NOT pull large results back to driver
-            await loop.run_in_executor(None, lambda: dist_wait(futures))
+            await _wait_futures(futures)
 
             # Check exceptions and optionally collect delayed results
             for sink, future in zip(output_sinks, futures):
@@ -629,12 +1076,12 @@ async def execute_graph(graph: dict, execution_id: str = None):
                     # dask.delayed: safe to call result() — returns small values
                     # None return is valid success; exception propagates
                     # delayed functions may return None (valid success); result() propagates exceptions
-                    _ = await loop.run_in_executor(None, future.result)
+                    _ = await loop.run_in_executor(_IO_POOL, future.result)
                     # value may be None (valid) — do not confuse with failure
                 else:
                     # Dask array or other large collection:
                     # DO NOT call future.result() — that materializes the full array on the driver
-                    exc = await loop.run_in_executor(None, future.exception)
+                    exc = await loop.run_in_executor(_IO_POOL, future.exception)
                     if exc is not None:
                         raise exc
 
@@ -643,22 +1090,30 @@ async def execute_graph(graph: dict, execution_id: str = None):
             instance = node_instances.get(nid)
             postprocess = getattr(instance, "postprocess", None)
             if callable(postprocess):
-                post_value = postprocess(
-                    outputs=results.get(nid),
-                    state=getattr(instance, "_preprocess_state", None),
-                    runtime={"execution_id": execution_id, "node_id": nid},
-                )
+                post_kwargs = {
+                    "outputs": results[id_to_idx[nid]],
+                    "state": getattr(instance, "_preprocess_state", None),
+                    "runtime": {"execution_id": execution_id, "node_id": nid},
+                }
+                if inspect.iscoroutinefunction(postprocess):
+                    post_value = postprocess(**post_kwargs)
+                else:
+                    # Writers finalize metadata and swap directories here.
+                    post_value = await loop.run_in_executor(
+                        _IO_POOL, lambda: postprocess(**post_kwargs)
+                    )
                 if inspect.isawaitable(post_value):
                     post_value = await post_value
                 if post_value is not None:
-                    results[nid] = post_value
+                    results[id_to_idx[nid]] = post_value
 
         # Send done state for all output nodes
         for nid in output_nodes:
-            await progress_callback(nid, 100, "Done", "done")
+            progress_callback(nid, 100, "Done", "done")
 
         # Success
         state_manager.set_execution_status(execution_id, ExecutionStatus.SUCCEEDED)
+        await flush_messages()
         await state_manager.broadcast(execution_id, {
             "type": "execution_finished",
             "executionId": execution_id,
@@ -678,6 +1133,7 @@ async def execute_graph(graph: dict, execution_id: str = None):
         should_cancel_dask_objects = True
         logger.warning("Execution Cancelled.")
         state_manager.set_execution_status(execution_id, ExecutionStatus.CANCELLED)
+        await flush_messages()
         await state_manager.broadcast(execution_id, {
             "type": "execution_finished",
             "executionId": execution_id,
@@ -688,6 +1144,7 @@ async def execute_graph(graph: dict, execution_id: str = None):
     except Exception as e:
         should_cancel_dask_objects = True
         traceback.print_exc()
+        await flush_messages()
 
         session = state_manager.get_execution(execution_id)
         if session and session.status == ExecutionStatus.CANCELLING:
@@ -710,12 +1167,14 @@ async def execute_graph(graph: dict, execution_id: str = None):
             })
             state_manager.add_log(f"Global Error: {str(e)}", "error", execution_id=execution_id)
     finally:
-        mem_monitor.log_snapshot("execution_end_before_cleanup", client=client)
+        await log_memory("execution_end_before_cleanup")
 
         # Cancel asyncio tasks
         for t in tasks.values():
             if not t.done():
                 t.cancel()
+        if not sender_task.done():
+            sender_task.cancel()
 
         # node cleanup: only on abnormal exit (failure/cancel), never on success
         if should_cancel_dask_objects:
@@ -738,7 +1197,7 @@ async def execute_graph(graph: dict, execution_id: str = None):
                     logger.debug(f"[Cleanup] Cancel failed: {exc}")
 
             try:
-                stats = client.run(force_clear_worker_cache)
+                stats = await loop.run_in_executor(_IO_POOL, client.run, force_clear_worker_cache)
                 logger.info(f"[Cleanup] Worker cache cleared: {stats}")
             except Exception as exc:
                 logger.debug(f"[Cleanup] Worker cache clear failed: {exc}")
@@ -749,7 +1208,7 @@ async def execute_graph(graph: dict, execution_id: str = None):
 
         state_manager.cleanup_old_executions()
 
-        mem_monitor.log_snapshot("execution_end_after_cleanup", client=client)
+        await log_memory("execution_end_after_cleanup")
         mem_monitor.log_delta("execution_start", "execution_end_before_cleanup")
 
         cleanup_result = mem_monitor.log_delta(
@@ -0,0 +1,74 @@
+import asyncio
+import os
+import sys
+import unittest
+
+import dask.array as da
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.registry import register_node  # noqa: E402
+from services import executor  # noqa: E402
+import nodes.type_cast_node  # noqa: E402,F401  registers DaskTypeCast
+
+
+@register_node("_TestArraySource")
+class _TestArraySource:
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {"required": {}}
+
+    RETURN_TYPES = ("DASK_ARRAY[uint16]",)
+    FUNCTION = "load"
+
+    def load(self, **kwargs):
+        return (da.from_array(np.array([10, 300, 20], dtype=np.uint16), chunks=2),)
+
+
+@register_node("_TestMaxSink")
+class _TestMaxSink:
+    OUTPUT_NODE = True
+    seen = []
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {"required": {"dask_arr": ("DASK_ARRAY[any]",)}}
+
+    RETURN_TYPES = ()
+    FUNCTION = "save"
+
+    def save(self, dask_arr, **kwargs):
+        type(self).seen.append(float(dask_arr.max().compute(scheduler="sync")))
+        return ()
+
+
+def _graph(first_dtype):
+    return {
+        "1": {"type": "_TestArraySource", "inputs": {}},
+        "2": {"type": "DaskTypeCast", "inputs": {"dask_arr": ["1", 0], "target_dtype": first_dtype, "clip": True}},
+        "3": {"type": "DaskTypeCast", "inputs": {"dask_arr": ["2", 0], "target_dtype": "float32", "clip": True}},
+        "4": {"type": "_TestMaxSink", "inputs": {"dask_arr": ["3", 0]}},
+    }
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        executor._result_cache_clear()
+        _TestMaxSink.seen = []
+
+    def test_upstream_parameter_change_invalidates_downstream(self):
+        asyncio.run(executor.execute_graph(_graph("uint16")))
+        asyncio.run(executor.execute_graph(_graph("uint8")))
+        self.assertEqual(_TestMaxSink.seen, [300.0, 255.0])
+
+    def test_unchanged_graph_reuses_cached_results(self):
+        asyncio.run(executor.execute_graph(_graph("uint16")))
+        cached = dict(executor._RESULT_CACHE)
+        asyncio.run(executor.execute_graph(_graph("uint16")))
+        self.assertEqual(_TestMaxSink.seen, [300.0, 300.0])
+        self.assertEqual(dict(executor._RESULT_CACHE), cached)
+
+
+if __name__ == "__main__":
+    unittest.main()
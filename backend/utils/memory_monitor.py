@@ -36,6 +36,7 @@ class MemoryMonitor:
         # 检测可用的监控后端
         self._has_psutil = self._check_psutil()
         self._has_torch = self._check_torch()
+        self._process = None  # psutil.Process for this PID, created on first use
 
     def reset_for_execution(self, execution_id: str):
         """
@@ -70,9 +71,10 @@ class MemoryMonitor:
         if not self._has_psutil:
             return None
         try:
-            import psutil
-            process = psutil.Process(os.getpid())
-            return process.memory_info().rss / (1024 * 1024)
+            if self._process is None or self._process.pid != os.getpid():
+                import psutil
+                self._process = psutil.Process(os.getpid())
+            return self._process.memory_info().rss / (1024 * 1024)
         except Exception as e:
             logger.debug(f"[MemoryMonitor] Failed to get process memory: {e}")
             return None
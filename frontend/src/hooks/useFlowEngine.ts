@@ -212,15 +212,7 @@ export const useFlowEngine = (
       // ========================================================
       // Message handling uses refs for latest state.
       // ========================================================
-      ws.onmessage = (e) => {
-        let msg: WSMessage;
-        try {
-          msg = JSON.parse(e.data);
-        } catch {
-          console.error('[useFlowEngine] parse error', e.data);
-          return;
-        }
-
+      const handleMessage = (msg: WSMessage) => {
         const msgType = msg.type;
 
         // Log messages
@@ -444,6 +436,23 @@ export const useFlowEngine = (
         }
         if (msgType === 'pong') return;
       };
+
+      ws.onmessage = (e) => {
+        let msg: WSMessage;
+        try {
+          msg = JSON.parse(e.data);
+        } catch {
+          console.error('[useFlowEngine] parse error', e.data);
+          return;
+        }
+
+        // The backend folds bursts of progress/log messages into one batch frame.
+        if (msg.type === 'batch') {
+          (msg.items ?? []).forEach(handleMessage);
+          return;
+        }
+        handleMessage(msg);
+      };
     };
 
     connectWs();
@@ -79,7 +79,8 @@ export type WSMessageType =
   | 'execution_control_ack'
   | 'subscribed'
   | 'ping'
-  | 'pong';
+  | 'pong'
+  | 'batch';
 
 export interface WSMessage {
   type: WSMessageType;
@@ -107,6 +108,9 @@ export interface WSMessage {
   nodeCount?: number;
   logCount?: number;
   action?: string;
+
+  // Present on 'batch' frames: messages to handle in order.
+  items?: WSMessage[];
 }
 
 export interface Workflow {